@@ -0,0 +1,245 @@
+"""
+Modul für die durchsuchbare, filterbare und seitenweise Ländertabelle.
+Die Rangfolgen je Jahr sowie ein Trigramm-Index über die Ländernamen
+werden einmalig aufgebaut, sodass Suche, Filter und Blättern ohne erneutes Sortieren auskommen.
+Hinweis: st.text_input löst erst bei Enter oder Fokusverlust aus, die Suche aktualisiert sich daher nicht bei jedem Tastendruck.
+"""
+
+# Bibliotheken importieren
+import math
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+# Anzahl der Zeilen pro Tabellenseite
+PAGE_SIZE = 25
+
+# Sortierungen der Tabelle -> Schlüssel der vorsortierten Reihenfolgen
+SORT_OPTIONS = {
+    "Wert absteigend": "desc",
+    "Wert aufsteigend": "asc",
+    "Name (A–Z)": "name",
+}
+
+# Hinweis an den Spaltenköpfen, da st.dataframe nur die sichtbare Seite erhält
+PAGE_SORT_HELP = "Spaltensortierung gilt nur für die aktuelle Seite – für alle Länder die Auswahl „Sortierung“ nutzen."
+
+# Sammelgruppe für Länder ohne zuordenbaren Kontinent
+UNKNOWN_CONTINENT = "Unbekannt"
+
+# Abweichende Ländernamen der Finanzdatensätze -> Name im Bevölkerungsdatensatz
+CONTINENT_ALIASES = {
+    "Anguila": "Anguilla",
+    "Bahamas, The": "Bahamas",
+    "Belgium-Luxembourg": "Belgium",
+    "Brunei Darussalam": "Brunei",
+    "Cabo Verde": "Cape Verde",
+    "Congo, Dem. Rep.": "DR Congo",
+    "Congo, Dem. Rep. of the": "DR Congo",
+    "Congo, Rep.": "Republic of the Congo",
+    "Congo, Republic of": "Republic of the Congo",
+    "Cote d'Ivoire": "Ivory Coast",
+    "CÃ´te d'Ivoire": "Ivory Coast",
+    "CuraÃ§ao": "Curacao",
+    "Czechoslovakia": "Czech Republic",
+    "East Timor": "Timor-Leste",
+    "Ethiopia(excludes Eritrea)": "Ethiopia",
+    "Ethiopia(includes Eritrea)": "Ethiopia",
+    "Faeroe Islands": "Faroe Islands",
+    "Falkland Island": "Falkland Islands",
+    "Fm Sudan": "Sudan",
+    "Gambia, The": "Gambia",
+    "German Democratic Republic": "Germany",
+    "Holy See": "Vatican City",
+    "Hong Kong SAR": "Hong Kong",
+    "Korea, Dem. Rep.": "North Korea",
+    "Korea, Republic of": "South Korea",
+    "Kyrgyz Republic": "Kyrgyzstan",
+    "Lao P.D.R.": "Laos",
+    "Lao PDR": "Laos",
+    "Macao": "Macau",
+    "Macao SAR": "Macau",
+    "Netherlands Antilles": "Curacao",
+    "Occ.Pal.Terr": "Palestine",
+    "Saint BarthÃ©lemy": "Saint Barthelemy",
+    "Saint Maarten (Dutch part)": "Sint Maarten",
+    "Serbia, FR(Serbia/Montenegro)": "Serbia",
+    "Slovak Republic": "Slovakia",
+    "South Sudan, Republic of": "South Sudan",
+    "Soviet Union": "Russia",
+    "St. Kitts and Nevis": "Saint Kitts and Nevis",
+    "St. Lucia": "Saint Lucia",
+    "Syrian Arab Republic": "Syria",
+    "SÃ£o TomÃ© and PrÃ\xadncipe": "Sao Tome and Principe",
+    "Turks and Caicos Isl.": "Turks and Caicos Islands",
+    "Wallis and Futura Isl.": "Wallis and Futuna",
+    "West Bank and Gaza": "Palestine",
+    "Yemen Democratic": "Yemen",
+    "Yugoslavia,FR(Serbia/Montenegr": "Serbia",
+}
+
+
+class CountryTableIndex:
+    """Vorsortierte Ranglisten je Jahr und Namensindex für eine Ländertabelle."""
+
+    def __init__(self, names, values_by_year, continents=None):
+        self.names = np.asarray(names, dtype=object)
+        size = len(self.names)
+        if continents is None:
+            continents = [None] * size
+        else:
+            # Länder ohne Kontinent bleiben über die Sammelgruppe filterbar
+            continents = [c if isinstance(c, str) else UNKNOWN_CONTINENT for c in continents]
+        self.continents = np.asarray(continents, dtype=object)
+
+        # Namen in Kleinschreibung einmalig alphabetisch sortieren
+        self._keys = [str(name).lower() for name in self.names]
+        name_order = np.argsort(np.asarray(self._keys, dtype=object), kind="stable")
+
+        # Rangfolge (absteigend), Namensreihenfolge und Wertebereich je Jahr vorberechnen, fehlende Werte ausschließen
+        self.values = {}
+        self.ranks = {}
+        self.name_orders = {}
+        self.bounds = {}
+        for year, values in values_by_year.items():
+            values = np.asarray(values, dtype=float)
+            valid = np.flatnonzero(~np.isnan(values))
+            order = valid[np.argsort(-values[valid], kind="stable")]
+            self.values[year] = values
+            self.ranks[year] = order
+            self.name_orders[year] = name_order[~np.isnan(values[name_order])]
+            self.bounds[year] = (float(values[valid].min()), float(values[valid].max())) if len(valid) else (0.0, 0.0)
+
+        # Kontinent-Masken für schnelles Filtern
+        self.continent_masks = {
+            continent: self.continents == continent
+            for continent in sorted({c for c in self.continents if isinstance(c, str)},
+                                    key=lambda c: (c == UNKNOWN_CONTINENT, c))
+        }
+
+        # Trigramm-Index über die Namen in Kleinschreibung: Trigramm -> Menge der Zeilennummern
+        self._trigrams = {}
+        for i, key in enumerate(self._keys):
+            for pos in range(len(key) - 2):
+                self._trigrams.setdefault(key[pos:pos + 3], set()).add(i)
+
+    @property
+    def continent_options(self):
+        return list(self.continent_masks)
+
+    def search(self, query):
+        """Liefert eine boolesche Maske der Länder, deren Name die Suche enthält (None = keine Suche)."""
+        query = query.strip().lower()
+        if not query:
+            return None
+        mask = np.zeros(len(self.names), dtype=bool)
+
+        # Teilstring-Suche für jede Länge: kurze Eingaben durchsuchen alle Namen,
+        # längere nur die Schnittmenge der Trigramm-Listen
+        if len(query) < 3:
+            candidates = range(len(self._keys))
+        else:
+            postings = [self._trigrams.get(query[pos:pos + 3], set()) for pos in range(len(query) - 2)]
+            candidates = set.intersection(*sorted(postings, key=len))
+        hits = [i for i in candidates if query in self._keys[i]]
+        mask[hits] = True
+        return mask
+
+    def filter_mask(self, query="", continents=()):
+        """Kombiniert Namenssuche und Kontinentfilter zu einer Maske (None = ungefiltert)."""
+        mask = self.search(query)
+        if continents:
+            continent_mask = np.logical_or.reduce([self.continent_masks[c] for c in continents])
+            mask = continent_mask if mask is None else mask & continent_mask
+        return mask
+
+    def ranked_ids(self, year, mask=None, sort="desc"):
+        """Zeilennummern eines Jahres in vorsortierter Reihenfolge ("desc", "asc" oder "name"), optional maskiert."""
+        if sort == "name":
+            order = self.name_orders[year]
+        else:
+            order = self.ranks[year] if sort == "desc" else self.ranks[year][::-1]
+        return order if mask is None else order[mask[order]]
+
+    def page(self, year, ids, page, page_size=PAGE_SIZE):
+        """Baut nur die sichtbaren Zeilen einer Seite als DataFrame auf."""
+        start = (page - 1) * page_size
+        visible = ids[start:start + page_size]
+        return pd.DataFrame({
+            "Country": self.names[visible],
+            "Continent": self.continents[visible],
+            "Value": self.values[year][visible],
+        })
+
+
+def build_country_index(df, country_col, year_cols, continents=None):
+    """Erzeugt einen CountryTableIndex aus einem breiten DataFrame (eine Spalte je Jahr)."""
+    values_by_year = {
+        year: pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
+        for year, col in year_cols.items()
+    }
+    return CountryTableIndex(df[country_col].astype(str).str.strip().to_numpy(), values_by_year, continents)
+
+
+def load_continent_lookup():
+    """Zuordnung Land -> Kontinent aus dem Bevölkerungsdatensatz, ergänzt um die Namensvarianten der Finanzdaten."""
+    df = pd.read_csv("Datasets/world_population.csv")
+    lookup = dict(zip(df["Country/Territory"], df["Continent"]))
+    lookup.update({alias: lookup[name] for alias, name in CONTINENT_ALIASES.items()})
+    return lookup
+
+
+def render_country_table(index, year, value_label, key, value_format="%f", min_value=None, height=600):
+    """Zeigt die Ländertabelle mit Suche, Kontinentfilter und Seitenauswahl an."""
+
+    # Eingaben für Suche, Filter und Sortierung; jede Änderung springt zurück auf die erste Seite
+    page_key = f"{key}_page"
+
+    def reset_page():
+        st.session_state[page_key] = 1
+
+    query = st.text_input("Land suchen", key=f"{key}_search", placeholder="z. B. land", on_change=reset_page)
+    selected_continents = []
+    if index.continent_options:
+        selected_continents = st.multiselect("Kontinent", index.continent_options, key=f"{key}_continent",
+                                             on_change=reset_page)
+
+    sort_label = st.selectbox("Sortierung", list(SORT_OPTIONS), key=f"{key}_sort", on_change=reset_page)
+
+    # Treffer in vorsortierter Reihenfolge ermitteln
+    ids = index.ranked_ids(year, index.filter_mask(query, selected_continents), SORT_OPTIONS[sort_label])
+    total = len(ids)
+    pages = max(1, math.ceil(total / PAGE_SIZE))
+
+    # Bei anderem Jahr zurück auf die erste Seite, sonst Seitenzahl an verkleinerte Treffermenge anpassen
+    year_key = f"{key}_year"
+    if st.session_state.get(year_key, year) != year:
+        reset_page()
+    st.session_state[year_key] = year
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = st.number_input("Seite", min_value=1, max_value=pages, step=1, key=page_key)
+
+    min_bound, max_bound = index.bounds[year]
+    min_value = min_bound if min_value is None else min_value
+    st.dataframe(
+        index.page(year, ids, int(page)),
+        column_order=("Country", "Continent", "Value") if index.continent_options else ("Country", "Value"),
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            # Ein Klick auf die Spaltenköpfe sortiert nur die angezeigte Seite
+            "Country": st.column_config.TextColumn("Land", help=PAGE_SORT_HELP),
+            "Continent": st.column_config.TextColumn("Kontinent", help=PAGE_SORT_HELP),
+            "Value": st.column_config.ProgressColumn(
+                value_label,
+                help=PAGE_SORT_HELP,
+                format=value_format,
+                min_value=min_value,
+                max_value=max_bound
+            )
+        },
+        height=height
+    )
+    st.caption(f"{total} Länder · Seite {int(page)} von {pages}")
@@ -12,6 +12,41 @@ import plotly.express as px
 import altair as alt
 import requests
 
+from Dashboards.country_table import build_country_index, load_continent_lookup, render_country_table
+
+# Liste mit zu ignorierenden Regionen (keine Länder)
+EXCLUDES = ["World", "Europe", "Eastern Europe", "Asia", "Africa", "America", "Caribbean", "Middle East", "Oceania",
+            "income", "Other", "unspecified", "regions", "nes"]
+
+# Ländertabelle je Finanzmetrik einmalig mit vorsortierten Ranglisten je Jahr aufbauen
+@st.cache_resource(show_spinner=False)
+def load_financial_index(metric):
+    """Erzeugt den Tabellenindex einer Finanzmetrik über alle verfügbaren Jahre."""
+    if metric in ["BIP", "Inflation"]:
+        path = "Datasets/world_gdp_data.csv" if metric == "BIP" else "Datasets/global_inflation_data.csv"
+        df = pd.read_csv(path, encoding="latin1", sep=";", on_bad_lines="skip")
+        df = df.rename(columns={"ï»¿country_name": "Country", "country_name": "Country"})
+        year_cols = {int(col): col for col in df.columns if col.isdigit()}
+    else:
+        trade_df = pd.read_csv("Datasets/34_years_world_export_import_dataset.csv", encoding="latin1", sep=";", on_bad_lines="skip")
+        trade_df.rename(columns={"Partner Name": "Country"}, inplace=True)
+        metric_col = "Export (US$ Thousand)" if metric == "Export" else "Import (US$ Thousand)"
+        trade_df["Country"] = trade_df["Country"].astype(str).str.strip()
+        trade_df[metric_col] = pd.to_numeric(trade_df[metric_col], errors="coerce")
+        trade_df = trade_df.dropna(subset=["Year"])
+        # Mehrfache Zeilen je Land und Jahr (z. B. China) bleiben wie in der Karte als eigene Einträge erhalten
+        trade_df["Entry"] = trade_df.groupby(["Country", "Year"]).cumcount()
+        df = trade_df.pivot(index=["Country", "Entry"], columns="Year", values=metric_col)
+        df.columns = [int(col) for col in df.columns]
+        df = df.reset_index()
+        year_cols = {col: col for col in df.columns if col not in ["Country", "Entry"]}
+
+    # Regionen entfernen und Kontinente aus dem Bevölkerungsdatensatz zuordnen
+    df["Country"] = df["Country"].astype(str).str.strip()
+    df = df[~df["Country"].str.contains('|'.join(EXCLUDES), case=False)].reset_index(drop=True)
+    continents = df["Country"].map(load_continent_lookup()).to_numpy()
+    return build_country_index(df, "Country", year_cols, continents=continents)
+
 # Hauptfunktion zur Anzeige des Finanz-Dashboards
 def render_financial_dashboard(selected_country):
     """Rendert das Finanz-Dashboard je nach Länderauswahl."""
@@ -28,10 +63,6 @@ def render_financial_dashboard(selected_country):
     infl_df.rename(columns={"ï»¿country_name": "country_name"}, inplace=True)
     trade_df.rename(columns={"Partner Name": "Country"}, inplace=True)
 
-    # Liste mit zu ignorierenden Regionen (keine Länder)
-    excludes = ["World", "Europe", "Eastern Europe", "Asia", "Africa", "America", "Caribbean", "Middle East", "Oceania",
-                "income", "Other", "unspecified", "regions", "nes"]
-
     # --------------------------
     # EINZELLAND-ANSICHT
     # --------------------------
@@ -207,7 +238,7 @@ def render_financial_dashboard(selected_country):
         df["Country"] = df["Country"].astype(str).str.strip()
         df["Value"] = pd.to_numeric(df["Value"], errors="coerce")
         df = df.dropna(subset=["Value"])
-        df = df[~df["Country"].str.contains('|'.join(excludes), case=False)]
+        df = df[~df["Country"].str.contains('|'.join(EXCLUDES), case=False)]
 
         # Skalierung für Darstellung mit log-ähnlicher Transformation
         def symlog(x, lin_thresh=1):
@@ -221,22 +252,7 @@ def render_financial_dashboard(selected_country):
         # Anzeige der Top-Werte als Liste mit Fortschrittsbalken
         with col1:
             st.markdown(f"### 💰 {metric} aller Länder im Jahr {year}")
-            df_display = df.sort_values("Value", ascending=False)
-            st.dataframe(
-                df_display[["Country", "Value"]],
-                use_container_width=True,
-                hide_index=True,
-                height=600,
-                column_config={
-                    "Country": st.column_config.TextColumn("Land"),
-                    "Value": st.column_config.ProgressColumn(
-                        metric,
-                        format="%f",
-                        min_value=float(df["Value"].min()),
-                        max_value=float(df["Value"].max())
-                    )
-                }
-            )
+            render_country_table(load_financial_index(metric), int(year), metric, key=f"fin_table_{metric}")
 
         # Darstellung der Weltkarte mit Choroplethen
         with col2:
@@ -276,12 +292,12 @@ def render_financial_dashboard(selected_country):
             df_heat = df_heat.drop(columns=["indicator_name"], errors='ignore')
             selected_years = [str(y) for y in range(2000, 2025, 4)]
             df_heat = df_heat[["country_name"] + selected_years]
-            df_heat = df_heat[~df_heat["country_name"].str.contains('|'.join(excludes), case=False)]
+            df_heat = df_heat[~df_heat["country_name"].str.contains('|'.join(EXCLUDES), case=False)]
             df_melt = df_heat.melt(id_vars="country_name", var_name="Year", value_name="Value")
         else:
             metric_col = "Export (US$ Thousand)" if metric == "Export" else "Import (US$ Thousand)"
             df_heat = trade_df.rename(columns={metric_col: "Value", "Country": "country_name"})
-            df_heat = df_heat[~df_heat["country_name"].str.contains('|'.join(excludes), case=False)]
+            df_heat = df_heat[~df_heat["country_name"].str.contains('|'.join(EXCLUDES), case=False)]
             df_heat = df_heat[df_heat["Year"].isin([2000, 2004, 2008, 2012, 2016, 2020])]
             df_melt = df_heat[["country_name", "Year", "Value"]]
 
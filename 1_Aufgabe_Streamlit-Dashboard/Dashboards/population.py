@@ -11,6 +11,16 @@ import plotly.express as px
 import requests
 from countryinfo import CountryInfo
 
+from Dashboards.country_table import build_country_index, render_country_table
+
+# Ländertabelle einmalig mit vorsortierten Ranglisten je Jahr aufbauen
+@st.cache_resource(show_spinner=False)
+def load_population_index():
+    """Erzeugt den Tabellenindex für die Bevölkerung aller Länder."""
+    df = pd.read_csv("Datasets/world_population.csv")
+    year_cols = {year: f"{year} Population" for year in (2010, 2015, 2020, 2022)}
+    return build_country_index(df, "Country/Territory", year_cols, continents=df["Continent"].to_numpy())
+
 # Hauptfunktion zur Darstellung des Dashboards
 def render_population_dashboard(selected_country):
     """Visualisiert Bevölkerungsdaten für ein einzelnes Land oder global."""
@@ -30,7 +40,6 @@ def render_population_dashboard(selected_country):
     # Jahr für Standardanzeige setzen
     default_year = 2022
     df_selected = df_long[df_long["Year"] == default_year]
-    df_sorted = df_selected.sort_values(by="Population", ascending=False)
 
     # Länderansicht oder Weltansicht vorbereiten
     if selected_country != "Alle":
@@ -74,22 +83,7 @@ def render_population_dashboard(selected_country):
         # Tabelle mit allen Ländern & Bevölkerung
         with col1:
             st.markdown(f"### 🏆 Gesamtbevölerung aller Länder im Jahr {default_year}")
-            st.dataframe(
-                df_sorted[["Country/Territory", "Population"]],
-                column_order=("Country/Territory", "Population"),
-                hide_index=True,
-                use_container_width=True,
-                column_config={
-                    "Country/Territory": st.column_config.TextColumn("Land"),
-                    "Population": st.column_config.ProgressColumn(
-                        "Bevölkerung",
-                        format="%f",
-                        min_value=0,
-                        max_value=int(df_sorted["Population"].max())
-                    )
-                },
-                height=600
-            )
+            render_country_table(load_population_index(), default_year, "Bevölkerung", key="pop_table", min_value=0)
 
             # Jahresauswahl-Slider
             selected_year = st.slider("Wähle ein Jahr", min_value=2010, max_value=2022, step=5, value=default_year)
@@ -0,0 +1,6 @@
+"""Macht das Paket Dashboards für die Tests importierbar."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,101 @@
+"""Tests für den Such-, Filter- und Rangindex der Ländertabelle."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from Dashboards.country_table import CONTINENT_ALIASES, UNKNOWN_CONTINENT, CountryTableIndex
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Datasets")
+
+
+def make_index():
+    names = ["Laos", "Latvia", "Poland", "Finland", "Thailand", "Germany"]
+    values = {
+        2020: [5.0, 1.0, 3.0, np.nan, 4.0, 2.0],
+        2022: [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+    }
+    continents = ["Asia", "Europe", "Europe", "Europe", "Asia", None]
+    return CountryTableIndex(names, values, continents)
+
+
+def found(index, query):
+    return sorted(index.names[index.search(query)])
+
+
+def test_search_empty_query_returns_none():
+    assert make_index().search("  ") is None
+
+
+def test_search_short_query_matches_substrings():
+    assert found(make_index(), "la") == ["Finland", "Laos", "Latvia", "Poland", "Thailand"]
+
+
+def test_search_long_query_uses_trigrams_and_substrings():
+    index = make_index()
+    assert found(index, "LAND") == ["Finland", "Poland", "Thailand"]
+    assert found(index, "many") == ["Germany"]
+    assert found(index, "xyz") == []
+
+
+def test_search_results_shrink_as_query_grows():
+    index = make_index()
+    previous = set(index.names)
+    for end in range(1, len("thailand") + 1):
+        current = set(found(index, "thailand"[:end]))
+        assert current <= previous
+        previous = current
+    assert previous == {"Thailand"}
+
+
+def test_filter_mask_without_filters_is_none():
+    assert make_index().filter_mask() is None
+
+
+def test_filter_mask_with_continents_and_query():
+    index = make_index()
+    assert sorted(index.names[index.filter_mask(continents=["Asia"])]) == ["Laos", "Thailand"]
+    assert sorted(index.names[index.filter_mask("land", ["Europe"])]) == ["Finland", "Poland"]
+    assert sorted(index.names[index.filter_mask(continents=["Asia", "Europe"])]) == [
+        "Finland", "Laos", "Latvia", "Poland", "Thailand"]
+
+
+def test_missing_continent_goes_to_unknown_bucket():
+    index = make_index()
+    assert index.continent_options[-1] == UNKNOWN_CONTINENT
+    assert list(index.names[index.filter_mask(continents=[UNKNOWN_CONTINENT])]) == ["Germany"]
+
+
+def test_ranks_are_descending_and_exclude_nan():
+    index = make_index()
+    assert list(index.names[index.ranks[2020]]) == ["Laos", "Thailand", "Poland", "Germany", "Latvia"]
+    assert index.bounds[2020] == (1.0, 5.0)
+    assert list(index.names[index.ranked_ids(2020, index.filter_mask("land"))]) == ["Thailand", "Poland"]
+
+
+def test_ascending_and_name_orders_exclude_nan():
+    index = make_index()
+    assert list(index.names[index.ranked_ids(2020, sort="asc")]) == ["Latvia", "Germany", "Poland", "Thailand", "Laos"]
+    assert list(index.names[index.ranked_ids(2020, sort="name")]) == ["Germany", "Laos", "Latvia", "Poland", "Thailand"]
+    assert list(index.names[index.ranked_ids(2022, sort="name")]) == [
+        "Finland", "Germany", "Laos", "Latvia", "Poland", "Thailand"]
+    assert list(index.names[index.ranked_ids(2020, index.filter_mask("land"), sort="asc")]) == ["Poland", "Thailand"]
+
+
+def test_page_boundaries():
+    index = make_index()
+    ids = index.ranked_ids(2022)
+    last = index.page(2022, ids, 2, page_size=4)
+    assert list(last["Country"]) == ["Latvia", "Laos"]
+    assert list(last["Value"]) == [2.0, 1.0]
+
+    empty = index.page(2022, index.ranked_ids(2022, index.filter_mask("xyz")), 1)
+    assert empty.empty
+    assert list(empty.columns) == ["Country", "Continent", "Value"]
+
+
+def test_continent_aliases_point_to_population_countries():
+    population = pd.read_csv(os.path.join(DATASETS, "world_population.csv"))
+    missing = set(CONTINENT_ALIASES.values()) - set(population["Country/Territory"])
+    assert not missing
@@ -0,0 +1,39 @@
+"""Tests für den Tabellenindex der Finanzmetriken."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Dashboards.financial import EXCLUDES, load_financial_index
+
+DASHBOARD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def dashboard_dir(monkeypatch):
+    # Die Datensätze werden relativ zum Dashboard-Verzeichnis geladen
+    monkeypatch.chdir(DASHBOARD_DIR)
+
+
+def test_duplicate_trade_rows_stay_separate():
+    index = load_financial_index("Export")
+    ids = index.ranked_ids(1988, index.filter_mask("china"))
+    assert sorted(index.values[1988][ids]) == [13575267.56, 20401526.34]
+
+
+@pytest.mark.parametrize("metric", ["Export", "Import"])
+def test_trade_ranks_match_year_slice(metric):
+    index = load_financial_index(metric)
+    trade_df = pd.read_csv("Datasets/34_years_world_export_import_dataset.csv", encoding="latin1", sep=";",
+                           on_bad_lines="skip")
+    trade_df["Partner Name"] = trade_df["Partner Name"].astype(str).str.strip()
+    metric_col = f"{metric} (US$ Thousand)"
+    for year in index.ranks:
+        df = trade_df[trade_df["Year"] == year][["Partner Name", metric_col]].copy()
+        df[metric_col] = pd.to_numeric(df[metric_col], errors="coerce")
+        df = df.dropna(subset=[metric_col])
+        df = df[~df["Partner Name"].str.contains('|'.join(EXCLUDES), case=False)]
+        expected = df.sort_values(metric_col, ascending=False)[metric_col].to_numpy()
+        np.testing.assert_array_equal(index.values[year][index.ranks[year]], expected)